@@ -3,6 +3,7 @@
 # torchrun --nproc-per-node 4 test/local_test_optim.py
 
 import argparse
+import functools
 import os
 import unittest
 
@@ -27,8 +28,6 @@ schedule_map = {
 d_hid = 512
 batch_size = 256
 
-torch.manual_seed(0)
-
 
 # Basic example
 class ExampleCode(torch.nn.Module):
@@ -55,12 +54,20 @@ class ExampleCode(torch.nn.Module):
         return x
 
 
+@functools.lru_cache
+def get_example_data(device, dtype=torch.float32):
+    # Built once per (device, dtype) and shared by repeated runs in a process
+    x = torch.randn(batch_size, d_hid, device=device, dtype=dtype)
+    target = torch.randn(batch_size, d_hid, device=device, dtype=dtype)
+    return x, target
+
+
 def run_worker(args):
+    torch.manual_seed(0)
     mod = ExampleCode()
     mod.to(args.device)
 
-    x = torch.randn(batch_size, d_hid, device=args.device)
-    target = torch.randn(batch_size, d_hid, device=args.device)
+    x, target = get_example_data(args.device)
     loss_fn = torch.nn.MSELoss(reduction="sum")
 
     pipe = pipeline(